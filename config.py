@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Optional
 
 import pydantic
@@ -36,6 +37,7 @@ class Settings(BaseSettings):
         default="whisper", env="DEFAULT_TRANSCRIPTION_PROVIDER"
     )
     output_dir: str = Field(default="./output", env="OUTPUT_DIR")
+    compress_transcripts: bool = Field(default=True, env="COMPRESS_TRANSCRIPTS")
 
     meeting_provider_base_url: Optional[str] = Field(
         default=None, env="MEETING_PROVIDER_BASE_URL"
@@ -55,11 +57,17 @@ class Settings(BaseSettings):
             extra = "ignore"
 
 
-try:
-    settings = Settings()  # type: ignore
-except ValidationError as exc:
-    missing_keys = [err["loc"][0] for err in exc.errors()]
-    raise RuntimeError(f"Missing required environment variables: {missing_keys}") from exc
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    try:
+        loaded = Settings()  # type: ignore
+    except ValidationError as exc:
+        missing_keys = [err["loc"][0] for err in exc.errors()]
+        raise RuntimeError(f"Missing required environment variables: {missing_keys}") from exc
+
+    if not loaded.openai_api_key:
+        raise RuntimeError("OPENAI_API_KEY is required for the prototype to run.")
+    return loaded
+
 
-if not settings.openai_api_key:
-    raise RuntimeError("OPENAI_API_KEY is required for the prototype to run.")
+settings = get_settings()
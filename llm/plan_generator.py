@@ -1,20 +1,32 @@
-import json
+import hashlib
 import os
+import string
+from collections import OrderedDict
 from typing import Tuple
 
-from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI
+from pydantic import TypeAdapter
 
 from config import settings
 from models import LifestylePlan, SessionTranscript
+from utils import json_utils
 from utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
-# Allow direct env loading alongside settings for flexibility.
-load_dotenv()
+# config has already loaded .env; fall back to the raw environment for flexibility.
 OPENAI_API_KEY = settings.openai_api_key or os.getenv("OPENAI_API_KEY")
-client = OpenAI(api_key=OPENAI_API_KEY)
+client = AsyncOpenAI(api_key=OPENAI_API_KEY)
+# Older openai python versions lack the responses API; detect once instead of per call.
+_USE_RESPONSES_API = hasattr(client, "responses") and callable(getattr(client.responses, "create", None))
+
+_PLAN_ADAPTER = TypeAdapter(LifestylePlan)
+
+# Raw JSON of successful LLM responses keyed on (prompt digest, model), so retries and
+# re-processing of the same session skip the LLM call. functools.lru_cache cannot wrap
+# the async call (it would cache a single-use coroutine), hence the small manual LRU.
+_LLM_CACHE_MAXSIZE = 256
+_llm_cache: "OrderedDict[Tuple[bytes, str], str]" = OrderedDict()
 
 PROMPT_TEMPLATE = """
 You are a health coaching documentation assistant.
@@ -66,6 +78,11 @@ NOTES:
 <<NOTES_TEXT>>
 """
 
+# Compiled once at import so each request is a single substitution pass.
+_TEMPLATE = string.Template(
+    PROMPT_TEMPLATE.replace("<<TRANSCRIPT_TEXT>>", "${t}").replace("<<NOTES_TEXT>>", "${n}")
+)
+
 
 class PlanGenerationError(Exception):
     def __init__(self, message: str, raw_response: str | None = None):
@@ -73,12 +90,29 @@ class PlanGenerationError(Exception):
         self.raw_response = raw_response
 
 
-def generate_lifestyle_plan(transcript: SessionTranscript, notes: str) -> Tuple[LifestylePlan, str]:
-    transcript_text = transcript.raw_text
-    prompt = (
-        PROMPT_TEMPLATE.replace("<<TRANSCRIPT_TEXT>>", transcript_text or "")
-        .replace("<<NOTES_TEXT>>", notes or "")
+async def _request_plan_json(prompt: str) -> str | None:
+    if _USE_RESPONSES_API:
+        response = await client.responses.create(
+            model=settings.openai_llm_model,
+            input=prompt,
+            text={"format": {"type": "json_object"}},
+        )
+        # output_text joins the message text parts, skipping reasoning items and refusals.
+        return response.output_text
+    chat_resp = await client.chat.completions.create(
+        model=settings.openai_llm_model,
+        messages=[
+            {"role": "system", "content": "You are a JSON-only responder. Reply with JSON."},
+            {"role": "user", "content": prompt},
+        ],
+        response_format={"type": "json_object"},
     )
+    return chat_resp.choices[0].message.content  # type: ignore[attr-defined]
+
+
+async def generate_lifestyle_plan(transcript: SessionTranscript, notes: str) -> Tuple[LifestylePlan, str]:
+    transcript_text = transcript.raw_text
+    prompt = _TEMPLATE.substitute(t=transcript_text or "", n=notes or "")
 
     logger.info(
         "Generating lifestyle plan for session %s (transcript_chars=%s, notes_chars=%s)",
@@ -86,36 +120,34 @@ def generate_lifestyle_plan(transcript: SessionTranscript, notes: str) -> Tuple[
         len(transcript_text or ""),
         len(notes or ""),
     )
-    try:
-        response = client.responses.create(
-            model=settings.openai_llm_model,
-            input=prompt,
-            response_format={"type": "json_object"},
-        )
-        raw_json = response.output[0].content[0].text
-    except TypeError:
-        # Fallback for older openai python versions without responses API
-        chat_resp = client.chat.completions.create(
-            model=settings.openai_llm_model,
-            messages=[
-                {"role": "system", "content": "You are a JSON-only responder. Reply with JSON."},
-                {"role": "user", "content": prompt},
-            ],
-            response_format={"type": "json_object"},
-        )
-        raw_json = chat_resp.choices[0].message.content  # type: ignore[attr-defined]
+    # The template is fixed, so the prompt digest identifies (transcript, notes).
+    cache_key = (hashlib.blake2b(prompt.encode("utf-8")).digest(), settings.openai_llm_model)
+    raw_json = _llm_cache.get(cache_key)
+    if raw_json is not None:
+        _llm_cache.move_to_end(cache_key)
+        logger.info("Reusing cached LLM response for session %s", transcript.session_id)
+    else:
+        raw_json = await _request_plan_json(prompt)
     logger.info("LLM raw JSON length: %s", len(raw_json or ""))
 
+    if not raw_json:
+        logger.error("LLM returned an empty response")
+        raise PlanGenerationError("Failed to parse LLM response", raw_response=raw_json)
+
     try:
-        data = json.loads(raw_json)
-    except json.JSONDecodeError as exc:
+        data = json_utils.loads(raw_json)
+    except json_utils.JSONDecodeError as exc:
         logger.error("Failed to parse LLM JSON: %s", exc)
         raise PlanGenerationError("Failed to parse LLM response", raw_response=raw_json) from exc
 
     try:
-        plan = LifestylePlan(**data)
+        plan = _PLAN_ADAPTER.validate_python(data)
     except Exception as exc:
         logger.error("Failed to validate LLM JSON against schema: %s", exc)
         raise PlanGenerationError("LLM response did not match schema", raw_response=raw_json) from exc
 
+    # Only cache responses that produced a valid plan so failed generations are retried.
+    _llm_cache[cache_key] = raw_json
+    if len(_llm_cache) > _LLM_CACHE_MAXSIZE:
+        _llm_cache.popitem(last=False)
     return plan, raw_json
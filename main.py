@@ -1,3 +1,4 @@
+import asyncio
 from pathlib import Path
 from typing import Optional
 
@@ -15,11 +16,6 @@ logger = get_logger(__name__)
 app = typer.Typer(help="Evida coaching pipeline prototype (CLI only).")
 
 
-def _load_audio_bytes(audio_path: Path) -> bytes:
-    with open(audio_path, "rb") as f:
-        return f.read()
-
-
 def _load_notes(notes_path: Optional[Path]) -> str:
     if not notes_path:
         return ""
@@ -28,13 +24,15 @@ def _load_notes(notes_path: Optional[Path]) -> str:
 
 
 def _load_transcript_json(transcript_path: Path):
-    import json
-
     from models import SessionTranscript
+    from utils import json_utils
+
+    raw = transcript_path.read_bytes()
+    if transcript_path.suffix == ".zst":
+        import zstandard
 
-    with open(transcript_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    return SessionTranscript(**data)
+        raw = zstandard.ZstdDecompressor().decompress(raw)
+    return SessionTranscript(**json_utils.loads(raw))
 
 
 def _choose_provider(name: str):
@@ -60,7 +58,7 @@ def process_local_audio(
         file_okay=True,
         dir_okay=False,
         readable=True,
-        help="Optional path to a pre-generated transcript JSON to skip speech-to-text.",
+        help="Optional path to a pre-generated transcript JSON (or .json.zst) to skip speech-to-text.",
     ),
 ):
     """
@@ -74,7 +72,6 @@ def process_local_audio(
     typer.echo(f"[info] notes={'provided' if notes_path else 'none'}")
     typer.echo(f"[info] transcript_source={'file' if transcript_path else 'stt'}")
 
-    audio_bytes = _load_audio_bytes(audio_path)
     notes_text = _load_notes(notes_path)
 
     if transcript_path:
@@ -83,14 +80,15 @@ def process_local_audio(
     else:
         transcription_provider = _choose_provider(chosen_provider)
         try:
-            transcript = transcription_provider.transcribe_audio(audio_bytes, session_identifier)
+            with open(audio_path, "rb") as audio_file:
+                transcript = transcription_provider.transcribe_audio(audio_file, session_identifier)
         except Exception as exc:
             logger.error("Transcription failed: %s", exc)
             raise typer.Exit(code=1)
         logger.info("Transcription completed for session %s", session_identifier)
 
     try:
-        plan, raw_json = generate_lifestyle_plan(transcript, notes_text)
+        plan, raw_json = asyncio.run(generate_lifestyle_plan(transcript, notes_text))
     except PlanGenerationError as exc:
         logger.error("Plan generation failed: %s", exc)
         session_dir = save_failure_outputs(
@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from typing import List, Optional
 
 from pydantic import BaseModel
@@ -19,7 +20,10 @@ class LifestylePlan(BaseModel):
     social_connections: Domain
 
 
-class TranscriptUtterance(BaseModel):
+# A slotted dataclass rather than a BaseModel: transcripts hold thousands of these.
+# Pydantic still validates and serialises it as a field of SessionTranscript.
+@dataclass(frozen=True, slots=True, kw_only=True)
+class TranscriptUtterance:
     speaker: str
     start_time: Optional[float] = None
     end_time: Optional[float] = None
@@ -1,8 +1,9 @@
-import hashlib
+import asyncio
 import hmac
 import json
+import re
 import time
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 from fastapi import FastAPI, HTTPException, Request
 
@@ -16,6 +17,9 @@ app = FastAPI()
 logger = get_logger(__name__)
 
 WEBHOOK_SECRET = settings.meeting_provider_webhook_secret
+_SECRET_BYTES = WEBHOOK_SECRET.encode("utf-8") if WEBHOOK_SECRET else b""
+_SIG_RE = re.compile(r"(?:^|,)\s*(t|v[01])=([^,]+)")
+_HEX_SHA256_RE = re.compile(r"[0-9a-f]{64}")
 
 
 def _parse_signature_header(signature_header: str) -> Tuple[Optional[int], Optional[str]]:
@@ -23,18 +27,14 @@ def _parse_signature_header(signature_header: str) -> Tuple[Optional[int], Optio
     Expected format similar to: 't=1739537297,v1=abcdef...' (or v0)
     Returns (timestamp, signature) or (None, None) on failure.
     """
+    fields = {key: value.strip() for key, value in _SIG_RE.findall(signature_header)}
+    t_value = fields.get("t")
+    v0_sig = fields.get("v1") or fields.get("v0")
+    if not t_value or not v0_sig:
+        return None, None
     try:
-        parts = [p.strip() for p in signature_header.split(",")]
-        t_part = next((p for p in parts if p.startswith("t=")), None)
-        v_part = next((p for p in parts if p.startswith("v1=")), None) or next(
-            (p for p in parts if p.startswith("v0=")), None
-        )
-        if not t_part or not v_part:
-            return None, None
-        timestamp = int(t_part.split("=", 1)[1])
-        v0_sig = v_part.split("=", 1)[1]
-        return timestamp, v0_sig
-    except Exception:
+        return int(t_value), v0_sig
+    except ValueError:
         return None, None
 
 
@@ -50,21 +50,26 @@ def verify_signature(payload: bytes, signature_header: Optional[str]) -> bool:
         logger.error("Signature header missing expected t= or v0/v1= parts: %s", signature_header)
         return False
 
+    # Reject malformed signatures before touching the (possibly large) body.
+    if not _HEX_SHA256_RE.fullmatch(v0_sig):
+        logger.error("Signature is not a hex-encoded SHA-256 digest: %s", v0_sig)
+        return False
+
     # Reject stale signatures (30-minute tolerance)
     tolerance_cutoff = int(time.time()) - 30 * 60
     if timestamp < tolerance_cutoff:
         logger.error("Signature timestamp too old: %s (cutoff %s)", timestamp, tolerance_cutoff)
         return False
 
-    full_payload = f"{timestamp}.{payload.decode('utf-8')}"
+    provided = bytes.fromhex(v0_sig)
+    full_payload = f"{timestamp}.".encode("utf-8") + payload
     mac = hmac.new(
-        key=WEBHOOK_SECRET.encode("utf-8"),
-        msg=full_payload.encode("utf-8"),
-        digestmod=hashlib.sha256,
+        key=_SECRET_BYTES,
+        msg=full_payload,
+        digestmod="sha256",
     )
-    digest = "v0=" + mac.hexdigest()
-    if not hmac.compare_digest(digest, v0_sig):
-        logger.error("Signature mismatch: expected %s computed %s", v0_sig, digest)
+    if not hmac.compare_digest(mac.digest(), provided):
+        logger.error("Signature mismatch for provided signature %s", v0_sig)
         return False
     return True
 
@@ -91,24 +96,37 @@ async def elevenlabs_webhook(request: Request):
         raise HTTPException(status_code=400, detail="Invalid JSON payload")
 
     data = payload.get("data") or {}
-    convo_id = data.get("conversation_id") or data.get("id") or "unknown"
+    convo_id = str(data.get("conversation_id") or data.get("id") or "unknown")
     transcript_items = data.get("transcript") or []
 
-    utterances = []
+    utterances: List[TranscriptUtterance] = []
+    raw_parts: List[str] = []
     for item in transcript_items:
-        msg = item.get("message") or item.get("text") or ""
-        if not msg:
-            continue
+        match item:
+            case {"message": str(msg)} if msg:
+                pass
+            case {"text": str(msg)} if msg:
+                pass
+            case _:
+                continue
         speaker = item.get("role") or item.get("speaker") or "unknown"
+        if not isinstance(speaker, str):
+            continue
         utterances.append(TranscriptUtterance(speaker=speaker, text=msg))
+        raw_parts.append(msg)
 
-    raw_text = "\n".join(u.text for u in utterances)
-    session_transcript = SessionTranscript(session_id=convo_id, raw_text=raw_text, transcript=utterances)
+    raw_text = "\n".join(raw_parts)
+    # Only string fields reach the utterances above, so skip re-validating every one.
+    session_transcript = SessionTranscript.model_construct(
+        session_id=convo_id, raw_text=raw_text, transcript=utterances
+    )
 
     try:
-        plan, _ = generate_lifestyle_plan(session_transcript, notes="")
+        plan, _ = await generate_lifestyle_plan(session_transcript, notes="")
     except PlanGenerationError as exc:
-        session_dir = save_failure_outputs(convo_id, session_transcript, exc.raw_response, str(exc))
+        session_dir = await asyncio.to_thread(
+            save_failure_outputs, convo_id, session_transcript, exc.raw_response, str(exc)
+        )
         logger.error("Plan generation failed for conversation %s: %s", convo_id, exc)
         return {
             "status": "plan_failed",
@@ -117,6 +135,6 @@ async def elevenlabs_webhook(request: Request):
             "error": str(exc),
         }
 
-    session_dir = save_session_outputs(convo_id, session_transcript, plan)
+    session_dir = await asyncio.to_thread(save_session_outputs, convo_id, session_transcript, plan)
     logger.info("Processed ElevenLabs transcript for %s", convo_id)
     return {"status": "ok", "conversation_id": convo_id, "session_dir": str(session_dir)}
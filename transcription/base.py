@@ -1,10 +1,11 @@
 from abc import ABC, abstractmethod
+from typing import BinaryIO
 
 from models import SessionTranscript
 
 
 class TranscriptionProvider(ABC):
     @abstractmethod
-    def transcribe_audio(self, audio_bytes: bytes, session_id: str) -> SessionTranscript:
-        """Return a SessionTranscript for the given audio bytes."""
+    def transcribe_audio(self, audio_file: BinaryIO, session_id: str) -> SessionTranscript:
+        """Return a SessionTranscript for the given binary audio file object."""
         raise NotImplementedError
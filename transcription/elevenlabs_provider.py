@@ -1,4 +1,4 @@
-from typing import List
+from typing import BinaryIO, List
 
 import requests
 
@@ -14,18 +14,20 @@ class ElevenLabsProvider(TranscriptionProvider):
         self.api_key = api_key
         self.model_name = model_name
         self.base_url = "https://api.elevenlabs.io/v1/speech-to-text"
+        # Reuse one pooled connection across calls instead of a fresh TLS handshake each time.
+        self._session = requests.Session()
+        self._session.headers.update({"xi-api-key": api_key})
 
-    def transcribe_audio(self, audio_bytes: bytes, session_id: str) -> SessionTranscript:
+    def transcribe_audio(self, audio_file: BinaryIO, session_id: str) -> SessionTranscript:
         logger.info("Transcribing audio via ElevenLabs for session %s", session_id)
-        headers = {"xi-api-key": self.api_key}
-        files = {"file": ("session.wav", audio_bytes, "application/octet-stream")}
+        files = {"file": ("session.wav", audio_file, "application/octet-stream")}
         data = {
             "model_id": self.model_name,  # ElevenLabs expects model_id
             "diarize": "true",
             "language": "en",
         }
 
-        response = requests.post(self.base_url, headers=headers, files=files, data=data, timeout=120)
+        response = self._session.post(self.base_url, files=files, data=data, timeout=120)
         try:
             response.raise_for_status()
         except requests.HTTPError as exc:
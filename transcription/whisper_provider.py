@@ -1,3 +1,5 @@
+from typing import BinaryIO
+
 from openai import OpenAI
 
 from config import settings
@@ -13,10 +15,10 @@ class WhisperProvider(TranscriptionProvider):
         self.client = OpenAI(api_key=api_key)
         self.model_name = model_name
 
-    def transcribe_audio(self, audio_bytes: bytes, session_id: str) -> SessionTranscript:
+    def transcribe_audio(self, audio_file: BinaryIO, session_id: str) -> SessionTranscript:
         logger.info("Transcribing audio via Whisper for session %s", session_id)
         resp = self.client.audio.transcriptions.create(
-            model=self.model_name, file=("session.wav", audio_bytes)
+            model=self.model_name, file=("session.wav", audio_file)
         )
         text = resp.text
         utterance = TranscriptUtterance(speaker="unknown", text=text)
@@ -1,8 +1,41 @@
-import json
 from pathlib import Path
 
+import jinja2
+import zstandard
+
 from config import settings
 from models import LifestylePlan, SessionTranscript
+from utils import json_utils
+
+_MD_TEMPLATE = jinja2.Template(
+    """\
+# Lifestyle Plan for session {{ session_id }}
+
+{% for domain_name, domain in plan.items() %}
+## {{ domain_name.replace("_", " ").title() }}
+
+**Baseline**
+
+{{ domain.baseline }}
+
+**SMART Goals**
+
+{% for goal in domain.smart_goals %}
+- {{ goal }}
+{% endfor %}
+
+**Tracking KPIs**
+
+{% for kpi in domain.tracking_kpis %}
+- {{ kpi }}
+{% endfor %}
+
+
+{% endfor %}
+""",
+    trim_blocks=True,
+    lstrip_blocks=True,
+)
 
 
 def ensure_output_dir() -> Path:
@@ -11,6 +44,21 @@ def ensure_output_dir() -> Path:
     return base
 
 
+def _save_transcript(session_dir: Path, transcript: SessionTranscript) -> None:
+    transcript_json = json_utils.dumps_pretty(transcript.model_dump())
+    plain_path = session_dir / "session_transcript.json"
+    compressed_path = session_dir / "session_transcript.json.zst"
+    if settings.compress_transcripts:
+        # Compressors are not thread-safe and saves run in worker threads, so build one per call.
+        compressed_path.write_bytes(zstandard.ZstdCompressor(level=3).compress(transcript_json))
+        stale_path = plain_path
+    else:
+        plain_path.write_bytes(transcript_json)
+        stale_path = compressed_path
+    # Drop the other variant left by an earlier run so the session has a single transcript.
+    stale_path.unlink(missing_ok=True)
+
+
 def save_session_outputs(
     session_id: str, transcript: SessionTranscript, plan: LifestylePlan
 ) -> Path:
@@ -18,27 +66,13 @@ def save_session_outputs(
     session_dir = base / session_id
     session_dir.mkdir(parents=True, exist_ok=True)
 
-    with open(session_dir / "session_transcript.json", "w", encoding="utf-8") as f:
-        json.dump(transcript.model_dump(), f, indent=2, ensure_ascii=False)
-
-    with open(session_dir / "session_plan.json", "w", encoding="utf-8") as f:
-        json.dump(plan.model_dump(), f, indent=2, ensure_ascii=False)
-
-    md_path = session_dir / "session_plan.md"
-    with open(md_path, "w", encoding="utf-8") as f:
-        f.write(f"# Lifestyle Plan for session {session_id}\n\n")
-        plan_dict = plan.model_dump()
-        for domain_name, domain in plan_dict.items():
-            title = domain_name.replace("_", " ").title()
-            f.write(f"## {title}\n\n")
-            f.write(f"**Baseline**\n\n{domain['baseline']}\n\n")
-            f.write("**SMART Goals**\n\n")
-            for goal in domain["smart_goals"]:
-                f.write(f"- {goal}\n")
-            f.write("\n**Tracking KPIs**\n\n")
-            for kpi in domain["tracking_kpis"]:
-                f.write(f"- {kpi}\n")
-            f.write("\n\n")
+    _save_transcript(session_dir, transcript)
+
+    plan_dict = plan.model_dump()
+    (session_dir / "session_plan.json").write_bytes(json_utils.dumps_pretty(plan_dict))
+
+    markdown = _MD_TEMPLATE.render(session_id=session_id, plan=plan_dict)
+    (session_dir / "session_plan.md").write_text(markdown, encoding="utf-8")
 
     return session_dir
 
@@ -53,14 +87,12 @@ def save_failure_outputs(
     session_dir = base / session_id
     session_dir.mkdir(parents=True, exist_ok=True)
 
-    with open(session_dir / "session_transcript.json", "w", encoding="utf-8") as f:
-        json.dump(transcript.model_dump(), f, indent=2, ensure_ascii=False)
+    _save_transcript(session_dir, transcript)
 
-    failure_path = session_dir / "plan_failure.txt"
-    with open(failure_path, "w", encoding="utf-8") as f:
-        f.write(f"Plan generation failed: {error_message}\n\n")
-        if raw_response:
-            f.write("Raw LLM response:\n")
-            f.write(raw_response)
+    parts = [f"Plan generation failed: {error_message}\n\n"]
+    if raw_response:
+        parts.append("Raw LLM response:\n")
+        parts.append(raw_response)
+    (session_dir / "plan_failure.txt").write_text("".join(parts), encoding="utf-8")
 
     return session_dir